@@ -1,40 +1,153 @@
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 from fastapi.staticfiles import StaticFiles
+from functools import lru_cache
+import ast
+import operator
 import re
 import math
+import orjson
 
 app = FastAPI()
 
-# Serve static files (frontend)
-app.mount("/", StaticFiles(directory="static", html=True), name="static")
+# Small talk: one scan reports which intent matched via the group name
+_SMALLTALK_RE = re.compile(r"(?P<greeting>\b(?:hi|hello)\b)|(?P<name>your name)")
+
+SMALLTALK_REPLIES = {
+    "greeting": "👋 Hello! How can I help you today?",
+    "name": "🤖 I'm your FastAPI chatbot!",
+}
+
+
+# Weather query (demo response)
+def handle_weather(city):
+    return f"☁️ The weather in {city.title()} is currently sunny (demo response)."
+
+
+# Simple calculator
+# factorial/comb/perm are left out: small inputs produce huge integers
+_SAFE_NS = {
+    k: v for k, v in vars(math).items()
+    if not k.startswith("_") and k not in ("factorial", "comb", "perm")
+}
+
+_MAX_POW_BASE = 10**6
+_MAX_POW_EXPONENT = 1000
+# Every integer operand and result must fit, so no chain of operations
+# can build up numbers large enough to stall the event loop
+_MAX_INT_BITS = 4096
+
+_BIN_OPS = {
+    ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul,
+    ast.Div: operator.truediv, ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod, ast.Pow: operator.pow,
+}
+_UNARY_OPS = {ast.UAdd: operator.pos, ast.USub: operator.neg}
+
+_ALLOWED_NODES = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.Call, ast.Name, ast.Load,
+    ast.Constant, ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv,
+    ast.Mod, ast.Pow, ast.UAdd, ast.USub,
+)
+
+
+def _const_value(node):
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.UAdd, ast.USub)):
+        value = _const_value(node.operand)
+        return -value if isinstance(node.op, ast.USub) else value
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+        return node.value
+    raise ValueError("powers need numeric constant operands")
+
+
+def _validate(tree):
+    for node in ast.walk(tree):
+        if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Pow):
+            if (abs(_const_value(node.left)) > _MAX_POW_BASE
+                    or abs(_const_value(node.right)) > _MAX_POW_EXPONENT):
+                raise ValueError("power is too large")
+        if not isinstance(node, _ALLOWED_NODES):
+            raise ValueError(f"unsupported syntax: {type(node).__name__}")
+        if isinstance(node, ast.Name) and node.id not in _SAFE_NS:
+            raise ValueError(f"unknown name: {node.id}")
+        if isinstance(node, ast.Constant) and not isinstance(node.value, (int, float, complex)):
+            raise ValueError("only numbers are allowed")
+
+
+def _check_int(value):
+    if isinstance(value, int) and value.bit_length() > _MAX_INT_BITS:
+        raise ValueError("number is too large")
+    return value
+
+
+def _eval(node):
+    if isinstance(node, ast.Constant):
+        return _check_int(node.value)
+    if isinstance(node, ast.Name):
+        return _SAFE_NS[node.id]
+    if isinstance(node, ast.UnaryOp):
+        return _UNARY_OPS[type(node.op)](_eval(node.operand))
+    if isinstance(node, ast.BinOp):
+        left = _check_int(_eval(node.left))
+        right = _check_int(_eval(node.right))
+        if (isinstance(node.op, ast.Pow) and isinstance(left, int)
+                and isinstance(right, int)
+                and left.bit_length() * abs(right) > _MAX_INT_BITS):
+            raise ValueError("number is too large")
+        return _check_int(_BIN_OPS[type(node.op)](left, right))
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
+        args = [_check_int(_eval(arg)) for arg in node.args]
+        return _check_int(_SAFE_NS[node.func.id](*args))
+    raise ValueError(f"unsupported syntax: {type(node).__name__}")
+
+
+@lru_cache(maxsize=1024)
+def _parse_expr(expr):
+    tree = ast.parse(expr, mode="eval")
+    _validate(tree)
+    return tree.body
+
+
+def handle_calc(expr):
+    try:
+        result = _eval(_parse_expr(expr))
+        return f"🧮 Result: {result}"
+    except:
+        return "⚠️ Sorry, I couldn’t calculate that."
+
+
+def reply(text):
+    return Response(orjson.dumps({"response": text}), media_type="application/json")
+
+
+HANDLERS = (
+    ("weather in", handle_weather),
+    ("calc", handle_calc),
+)
+
 
 @app.post("/chat")
 async def chat(request: Request):
-    data = await request.json()
+    data = orjson.loads(await request.body())
     message = data.get("message", "").lower().strip()
 
-    response = "I'm not sure how to answer that yet."
+    for prefix, handler in HANDLERS:
+        if message.startswith(prefix):
+            return reply(handler(message[len(prefix):].strip()))
+
+    match = _SMALLTALK_RE.search(message)
+    if match:
+        return reply(SMALLTALK_REPLIES[match.lastgroup])
 
-    # Weather query (demo response)
-    if message.startswith("weather in"):
-        city = message.replace("weather in", "").strip().title()
-        response = f"☁️ The weather in {city} is currently sunny (demo response)."
+    return reply("I'm not sure how to answer that yet.")
 
-    # Simple calculator
-    elif message.startswith("calc"):
-        expr = message.replace("calc", "").strip()
-        try:
-            result = eval(expr, {"__builtins__": {}}, math.__dict__)
-            response = f"🧮 Result: {result}"
-        except:
-            response = "⚠️ Sorry, I couldn’t calculate that."
 
-    # Small talk
-    elif "hello" in message or "hi" in message:
-        response = "👋 Hello! How can I help you today?"
+# Serve static files (frontend); browsers revalidate via ETag after an hour
+class CachedStaticFiles(StaticFiles):
+    def file_response(self, *args, **kwargs):
+        response = super().file_response(*args, **kwargs)
+        response.headers.setdefault("cache-control", "public, max-age=3600")
+        return response
 
-    elif "your name" in message:
-        response = "🤖 I'm your FastAPI chatbot!"
 
-    return JSONResponse({"response": response})
+app.mount("/", CachedStaticFiles(directory="static", html=True), name="static")
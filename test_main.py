@@ -0,0 +1,81 @@
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from main import _eval, _parse_expr, app
+
+client = TestClient(app)
+
+CALC_ERROR = "⚠️ Sorry, I couldn’t calculate that."
+
+
+def chat(message):
+    response = client.post("/chat", json={"message": message})
+    assert response.status_code == 200
+    return response.json()["response"]
+
+
+def test_weather_demo_reply():
+    assert chat("Weather in paris") == "☁️ The weather in Paris is currently sunny (demo response)."
+
+
+def test_calc_evaluates_math_expressions():
+    assert chat("calc 2 + sqrt(16)") == "🧮 Result: 6.0"
+    assert chat("calc 2**10") == "🧮 Result: 1024"
+
+
+def test_calc_rejects_attribute_access_and_strings():
+    assert chat("calc (1).__class__") == CALC_ERROR
+    assert chat("calc 'a' * 3") == CALC_ERROR
+    assert chat("calc __import__('os')") == CALC_ERROR
+
+
+def test_calc_rejects_expensive_expressions_quickly():
+    start = time.perf_counter()
+    assert chat("calc 9**9**9**9") == CALC_ERROR
+    assert chat("calc 10**10**8") == CALC_ERROR
+    assert chat("calc factorial(10**6)") == CALC_ERROR
+    assert time.perf_counter() - start < 1
+
+
+@pytest.mark.parametrize("expr", [
+    "*".join(["1000000**1000"] * 200),
+    "*".join(["999999"] * 500),
+])
+def test_calc_bounds_long_multiplication_chains(expr):
+    start = time.perf_counter()
+    with pytest.raises(ValueError):
+        _eval(_parse_expr(expr))
+    assert time.perf_counter() - start < 1
+
+
+def test_long_calc_chains_fail_fast_end_to_end():
+    start = time.perf_counter()
+    assert chat("calc " + "*".join(["1000000**1000"] * 800)) == CALC_ERROR
+    assert time.perf_counter() - start < 1
+
+
+def test_greeting_matches_whole_words_only():
+    assert chat("hi there") == "👋 Hello! How can I help you today?"
+    assert chat("this is a test") == "I'm not sure how to answer that yet."
+
+
+def test_chat_route_not_shadowed_by_static_mount():
+    response = client.post("/chat", json={"message": "hello"})
+    assert response.status_code == 200
+
+
+def test_first_small_talk_intent_wins():
+    assert chat("your name? hi") == "🤖 I'm your FastAPI chatbot!"
+    assert chat("hi, what's your name?") == "👋 Hello! How can I help you today?"
+
+
+def test_static_files_are_cacheable():
+    response = client.get("/")
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "public, max-age=3600"
+
+    cached = client.get("/", headers={"if-none-match": response.headers["etag"]})
+    assert cached.status_code == 304
+    assert cached.headers["cache-control"] == "public, max-age=3600"